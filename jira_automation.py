@@ -1,10 +1,36 @@
 import os
+import argparse
+import asyncio
+import hashlib
+import io
+import re
+import tempfile
+import threading
+import time
+import zipfile
+import aiohttp
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from xml.sax.saxutils import escape
 from docx import Document
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
+from pathlib import Path
+
+# orjson is optional; it parses the large JIRA search pages several times faster than the stdlib
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# ijson's C backend is optional too; with it, large search pages are parsed while still downloading
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    ijson = None
 
 # Load environment variables
 load_dotenv()
@@ -14,15 +40,130 @@ JIRA_TOKEN = os.getenv("JIRA_TOKEN")
 JIRA_URL = os.getenv("JIRA_URL")
 JQL = os.getenv("JIRA_JQL")
 
-OLLAMA_URL = "http://localhost:11434/api/generate"
+JIRA_SEARCH_URL = "https://tracker.nci.nih.gov/rest/api/2/search"
+JIRA_PAGE_SIZE = 500  # JIRA caps this server-side; the loop in fetch_issues adapts
+JIRA_STREAM_PARSE_MIN_BYTES = 100 * 1024  # smaller pages are cheaper to parse in one go
+
+OLLAMA_HOST = "http://localhost:11434"
+OLLAMA_URL = f"{OLLAMA_HOST}/api/generate"
+OLLAMA_TIMEOUT = (5, 600)  # (connect, read) seconds; generation can take minutes
+OLLAMA_CACHE_DIR = Path(".cache") / "ollama"
+
+# Projects are fetched in parallel, but the local llama3 instance only copes
+# with a couple of generations at a time
+MAX_WORKERS = 8
+OLLAMA_CONCURRENCY = 2
+OLLAMA_SEMAPHORE = threading.Semaphore(OLLAMA_CONCURRENCY)
+
+# Leading "[BUG]"-style tags carry no meaning for the summary, only prompt tokens
+SUMMARY_TAG_PREFIX = re.compile(r"^(\s*\[[^\]]*\])+\s*")
+LLMLINGUA_MODEL = "NousResearch/Llama-2-7b-hf"
+LLMLINGUA_RATE = 0.4
+# llmlingua defaults to CUDA; set LLMLINGUA_DEVICE=cpu (or mps) on hosts without a GPU
+LLMLINGUA_DEVICE = os.getenv("LLMLINGUA_DEVICE", "cuda")
+
+# Shared HTTP session so every JIRA page and Ollama call reuses pooled connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+# Sent only on JIRA requests; the session is shared with Ollama, which must never see the token
+JIRA_HEADERS = {
+    "Authorization": f"Bearer {JIRA_TOKEN}",
+    "Accept": "application/json",
+}
+# Generation requests are safe to repeat, so retry POSTs to a restarting Ollama too.
+# A read timeout means the model is still working, so those are not retried (read=0).
+SESSION.mount(OLLAMA_HOST, HTTPAdapter(
+    max_retries=Retry(total=3, read=0, backoff_factor=1, status_forcelist=[500, 502, 503, 504], allowed_methods=frozenset({"POST"})),
+))
+
+# WordprocessingML fragments for the report body. The report has a fixed layout,
+# so word/document.xml is written directly instead of through python-docx's object model.
+TABLE_COLUMN_WIDTH = 2160  # twips: the default template's 6" text width split over four columns
+TABLE_HEADERS = ("Issue Type", "Issue key", "Summary", "Status")
+TABLE_START_XML = (
+    '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    '</w:tblPr><w:tblGrid>' + f'<w:gridCol w:w="{TABLE_COLUMN_WIDTH}"/>' * len(TABLE_HEADERS) + '</w:tblGrid>'
+)
+TABLE_CELL_XML = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{TABLE_COLUMN_WIDTH}"/></w:tcPr>{{}}</w:tc>'
+# A whole row with one "{}" slot per cell, so each row is a single str.format of pre-escaped text
+TABLE_ROW_XML = (
+    "<w:tr>"
+    + TABLE_CELL_XML.format('<w:p><w:r><w:t xml:space="preserve">{}</w:t></w:r></w:p>') * len(TABLE_HEADERS)
+    + "</w:tr>"
+)
+PAGE_BREAK_XML = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+# Control characters that are not allowed anywhere in an XML document
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _build_empty_template() -> bytes:
+    """Return the bytes of an empty .docx carrying python-docx's default styles"""
+    buffer = io.BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+# Built once at import so each report skips re-parsing python-docx's default template
+DOCX_TEMPLATE = _build_empty_template()
+
+
+def _text_xml(text: str) -> str:
+    """Escape text for a <w:t> element, turning newlines into line breaks within the run"""
+    escaped = escape(INVALID_XML_CHARS.sub("", str(text)))
+    return escaped.replace("\n", '</w:t><w:br/><w:t xml:space="preserve">')
+
+
+def _paragraph_xml(text: str, style: Optional[str] = None, center: bool = False) -> str:
+    """Render text as a single-run paragraph, turning newlines into line breaks"""
+    properties = ""
+    if style or center:
+        properties = "<w:pPr>"
+        if style:
+            properties += f'<w:pStyle w:val="{style}"/>'
+        if center:
+            properties += '<w:jc w:val="center"/>'
+        properties += "</w:pPr>"
+
+    return f'<w:p>{properties}<w:r><w:t xml:space="preserve">{_text_xml(text)}</w:t></w:r></w:p>'
+
+
+def _table_row_xml(values) -> str:
+    """Render one table row with a plain paragraph per cell"""
+    return TABLE_ROW_XML.format(*map(_text_xml, values))
+
+
+def _write_docx(template: bytes, body_xml: str, path: str):
+    """Write template to path with body_xml placed in front of its section properties"""
+    with zipfile.ZipFile(io.BytesIO(template)) as source, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == "word/document.xml":
+                head, sect_pr, tail = data.decode("utf-8").partition("<w:sectPr")
+                data = (head + body_xml + sect_pr + tail).encode("utf-8")
+            target.writestr(item, data)
 
 
 class JiraToDocxAutomation:
     """Main class for JIRA to DOCX automation system"""
     
-    def __init__(self, project_names: List[str]):
+    # The only issue fields the report and prompt read; "key" is always returned.
+    # Anything else (descriptions especially) just inflates every search page.
+    REQUIRED_FIELDS = ("issuetype", "summary", "status", "priority", "updated", "duedate")
+    
+    def __init__(self, project_names: List[str], use_cache: bool = True, compress_prompt: bool = False):
         self.validate_config()
         self.project_names = project_names if isinstance(project_names, list) else [project_names]
+        self.use_cache = use_cache
+        self.compress_prompt = compress_prompt
+        self._prompt_compressor = None
+        self._compressor_failed = False
+        self._compressor_lock = threading.Lock()
     
     @classmethod
     def from_env_projects(cls):
@@ -46,6 +187,49 @@ class JiraToDocxAutomation:
         if not JQL:
             raise ValueError("JIRA_JQL must be set in .env file")
 
+    def _search_params(self, project_name: str) -> Dict[str, Any]:
+        """Build the query parameters for the first page of a project's JIRA search"""
+        return {
+            "jql": "project = '" + project_name + "' " + JQL,
+            "fields": ",".join(self.REQUIRED_FIELDS),
+            "startAt": 0,
+            "maxResults": JIRA_PAGE_SIZE,
+        }
+
+    def _advance_page(self, params: Dict[str, Any], data: Dict[str, Any]) -> bool:
+        """
+        Move params on to the next page of a JIRA search
+        
+        Returns:
+            False once the last page has been received
+        """
+        page = data.get("issues", [])
+        total = data.get("total", 0)
+        if not page or params["startAt"] + len(page) >= total:
+            return False
+
+        # The server may cap maxResults below what we asked for;
+        # continue paging with the size it actually returns
+        if len(page) < params["maxResults"]:
+            params["maxResults"] = len(page)
+        params["startAt"] += len(page)
+        return True
+
+    def _read_search_page(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Parse one streamed JIRA search page
+        
+        Large pages (or ones without a Content-Length) are decoded incrementally
+        with ijson as the bytes arrive; small pages, or runs without ijson's
+        C backend installed, are read in full and parsed in one go.
+        """
+        length = int(response.headers.get("Content-Length", 0))
+        if ijson is None or 0 < length < JIRA_STREAM_PARSE_MIN_BYTES:
+            return _json.loads(response.content)
+
+        response.raw.decode_content = True
+        return dict(ijson.kvitems(response.raw, "", use_float=True))
+
     def fetch_issues(self, project_name: str) -> List[Dict[str, Any]]:
         """
         Fetch issues from JIRA using JQL
@@ -54,30 +238,30 @@ class JiraToDocxAutomation:
             List of issue dictionaries
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {JIRA_TOKEN}",
-                "Accept": "application/json",
-            }
-            
-            params = {
-                "jql": "project = '" + project_name + "' " + JQL,
-                "fields": "issuetype,key,summary,status,project,priority,assignee,reporter,created,updated,duedate",
-            }
+            params = self._search_params(project_name)
 
             print(f"Fetching issues from JIRA with JQL: project = '{project_name}' {JQL}")
-            response = requests.get(
-                "https://tracker.nci.nih.gov/rest/api/2/search", 
-                headers=headers, 
-                params=params,
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"JIRA API error: {response.status_code} - {response.text}")
-            
-            data = response.json()
-            issues = data.get("issues", [])
-            print(f"Successfully fetched {len(issues)} issues from JIRA")
+            issues = []
+            received = 0
+            while True:
+                with SESSION.get(
+                    JIRA_SEARCH_URL,
+                    headers=JIRA_HEADERS,
+                    params=params,
+                    stream=True,
+                    timeout=30
+                ) as response:
+                    if response.status_code != 200:
+                        raise Exception(f"JIRA API error: {response.status_code} - {response.text}")
+
+                    data = self._read_search_page(response)
+                    received += response.raw.tell()
+
+                issues.extend(data.get("issues", []))
+                if not self._advance_page(params, data):
+                    break
+
+            print(f"Successfully fetched {len(issues)} issues from JIRA ({received / 1024:.0f} KB)")
             return issues
             
         except requests.exceptions.RequestException as e:
@@ -86,6 +270,105 @@ class JiraToDocxAutomation:
         except Exception as e:
             print(f"Unexpected error: {e}")
             return []
+
+    async def fetch_issues_async(self, session: aiohttp.ClientSession, project_name: str) -> List[Dict[str, Any]]:
+        """
+        Fetch issues from JIRA using JQL without blocking the event loop
+        
+        Args:
+            session: aiohttp session shared by the whole run
+            project_name: JIRA project to query
+            
+        Returns:
+            List of issue dictionaries
+        """
+        try:
+            params = self._search_params(project_name)
+
+            print(f"Fetching issues from JIRA with JQL: project = '{project_name}' {JQL}")
+            issues = []
+            received = 0
+            while True:
+                async with session.get(
+                    JIRA_SEARCH_URL,
+                    headers=JIRA_HEADERS,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status != 200:
+                        raise Exception(f"JIRA API error: {response.status} - {await response.text()}")
+
+                    content = await response.read()
+
+                received += len(content)
+                data = _json.loads(content)
+
+                issues.extend(data.get("issues", []))
+                if not self._advance_page(params, data):
+                    break
+
+            print(f"Successfully fetched {len(issues)} issues from JIRA for {project_name} ({received / 1024:.0f} KB)")
+            return issues
+
+        except aiohttp.ClientError as e:
+            print(f"Error fetching issues from JIRA: {e}")
+            return []
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            return []
+
+    def _ollama_body(self, text: str) -> Dict[str, Any]:
+        """Build the Ollama generate request body for a project's issue list"""
+        return {
+            "model": "llama3",
+            "prompt": (
+                    "You are a project manager assistant. Given a list of JIRA issues or tasks grouped by status, "
+                    "one line per status in the form 'Status (count): Issue Key Summary (Priority, Updated, Due); ...', "
+                    "create a concise and professional high-level summary "
+                    "of planned or ongoing activities for this specific project in the current or upcoming month. "
+                    "Focus on key themes, major milestones, and overall project direction. Do not list individual issues. "
+                    "The overall summary should be limited to 150 words. Split the summary into two sections: Planned Activities and Completed Tasks from the past month. "
+                    "Additionally, provide a list of Deliverable tasks including the following fields: Due Date, Date Updated, Status, and Deliverable Name. "
+                    f"Here is the list of issues for this project: {text}"
+                ),
+            "stream": True
+        }
+    
+    def _summary_cache_path(self, body: Dict[str, Any]) -> Path:
+        """
+        Location of the cached summary for an Ollama request body
+        
+        The body is built from the uncompressed issue list, so a cache hit never
+        has to run LLMLingua; compressed runs get their own keys.
+        """
+        key_source = f"{body['model']}\n{body['prompt']}"
+        if self.compress_prompt:
+            key_source = f"llmlingua:{LLMLINGUA_MODEL}:{LLMLINGUA_RATE}\n{key_source}"
+        key = hashlib.sha256(key_source.encode()).hexdigest()
+        return OLLAMA_CACHE_DIR / f"{key}.txt"
+
+    def _read_cached_summary(self, cache_path: Path) -> Optional[str]:
+        """Return a previously generated summary, if caching is enabled and one exists"""
+        if not self.use_cache:
+            return None
+        if not cache_path.exists():
+            return None
+        print(f"Using cached Ollama summary: {cache_path}")
+        return cache_path.read_text(encoding="utf-8")
+
+    def _write_cached_summary(self, cache_path: Path, summary: str):
+        """Store a successfully generated summary for reuse on later runs"""
+        if not self.use_cache:
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and rename, so a concurrent or interrupted run never reads a partial summary
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp.write(summary)
+        try:
+            os.replace(tmp.name, cache_path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
     
     def summarize_with_ollama(self, text: str) -> str:
         """
@@ -99,38 +382,50 @@ class JiraToDocxAutomation:
         """
         try:
             # Prepare the request body for Ollama chat API
-            body = {
-                "model": "llama3",
-                "prompt": (
-                        "You are a project manager assistant. Given a list of JIRA issues or tasks with the fields: "
-                        "Issue Type, Issue Key, Summary, and Status, create a concise and professional high-level summary "
-                        "of planned or ongoing activities for this specific project in the current or upcoming month. "
-                        "Focus on key themes, major milestones, and overall project direction. Do not list individual issues. "
-                        "The overall summary should be limited to 150 words. Split the summary into two sections: Planned Activities and Completed Tasks from the past month. "
-                        "Additionally, provide a list of Deliverable tasks including the following fields: Due Date, Date Updated, Status, and Deliverable Name. "
-                        f"Here is the list of issues for this project: {text}"
-                    ),
-                "stream": False
-            }
-
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
+            body = self._ollama_body(text)
+
+            cache_path = self._summary_cache_path(body)
+            cached = self._read_cached_summary(cache_path)
+            if cached is not None:
+                return cached
+
+            if self.compress_prompt:
+                body = self._ollama_body(self._compress_issues_string(text))
+
             print("Generating summary with Ollama...")
-            response = requests.post(
-                OLLAMA_URL, 
+            started = time.perf_counter()
+            with SESSION.post(
+                OLLAMA_URL,
                 json=body,
-                headers=headers
-            )
+                stream=True,
+                timeout=OLLAMA_TIMEOUT
+            ) as response:
+                if response.status_code != 200:
+                    print(f"Ollama API error: {response.status_code} - {response.text}")
+                    return f"Error generating summary: {response.text}"
+                
+                # Ollama streams one JSON object per line as tokens are generated and
+                # ends the body after the "done" chunk; reading to the end lets the
+                # connection go back to the pool
+                parts = []
+                done = False
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json.loads(line)
+                    if "error" in chunk:
+                        raise Exception(chunk["error"])
+                    parts.append(chunk.get("response", ""))
+                    done = done or bool(chunk.get("done"))
             
-            if response.status_code != 200:
-                print(f"Ollama API error: {response.status_code} - {response.text}")
-                return f"Error generating summary: {response.text}"
+            # A stream cut short would otherwise be cached as a truncated summary
+            if not done:
+                raise Exception("Ollama stream ended before the summary was complete")
             
-            result = response.json()
-            summary = result.get("response", {})
-            return summary.strip()
+            summary = "".join(parts).strip()
+            print(f"Ollama summary generated in {time.perf_counter() - started:.1f}s")
+            self._write_cached_summary(cache_path, summary)
+            return summary
             
         except requests.exceptions.RequestException as e:
             print(f"Error connecting to Ollama: {e}")
@@ -139,23 +434,101 @@ class JiraToDocxAutomation:
             print(f"Unexpected error during summarization: {e}")
             return f"Error generating summary: {e}"
 
+    async def stream_summary_async(self, session: aiohttp.ClientSession, text: str) -> AsyncIterator[str]:
+        """
+        Stream an Ollama summary of text as it is generated
+        
+        Args:
+            session: aiohttp session shared by the whole run
+            text: The text to summarize
+            
+        Yields:
+            Pieces of the summary in generation order
+            
+        Raises:
+            Exception: If Ollama reports an error or the stream ends before its "done" chunk
+        """
+        body = self._ollama_body(text)
+
+        async with session.post(
+            OLLAMA_URL,
+            json=body,
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=OLLAMA_TIMEOUT[0], sock_read=OLLAMA_TIMEOUT[1])
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"Ollama API error: {response.status} - {await response.text()}")
 
-    def generate_word_document(self, projects_data: Dict[str, Dict], filename: str = "JIRA_Summary_Report.docx"):
+            # Ollama streams one JSON object per line as tokens are generated and
+            # ends the body after the "done" chunk; reading to the end lets the
+            # connection go back to the pool
+            done = False
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = _json.loads(line)
+                if "error" in chunk:
+                    raise Exception(chunk["error"])
+                yield chunk.get("response", "")
+                done = done or bool(chunk.get("done"))
+
+            if not done:
+                raise Exception("Ollama stream ended before the summary was complete")
+
+    async def summarize_async(self, session: aiohttp.ClientSession, text: str) -> str:
+        """
+        Summarize text using Ollama LLM without blocking the event loop
+        
+        Args:
+            session: aiohttp session shared by the whole run
+            text: The text to summarize
+            
+        Returns:
+            Summarized text
+        """
+        try:
+            cache_path = self._summary_cache_path(self._ollama_body(text))
+            cached = self._read_cached_summary(cache_path)
+            if cached is not None:
+                return cached
+
+            if self.compress_prompt:
+                # LLMLingua runs a local model; keep it off the event loop
+                text = await asyncio.to_thread(self._compress_issues_string, text)
+
+            started = time.perf_counter()
+            parts = [part async for part in self.stream_summary_async(session, text)]
+            summary = "".join(parts).strip()
+            print(f"Ollama summary generated in {time.perf_counter() - started:.1f}s")
+            self._write_cached_summary(cache_path, summary)
+            return summary
+
+        except aiohttp.ClientError as e:
+            print(f"Error connecting to Ollama: {e}")
+            return f"Error connecting to Ollama: {e}"
+        except asyncio.TimeoutError:
+            print("Timed out waiting for Ollama")
+            return "Error connecting to Ollama: timed out"
+        except Exception as e:
+            print(f"Unexpected error during summarization: {e}")
+            return f"Error generating summary: {e}"
+
+
+    def generate_word_document(self, projects_data: Dict[str, Dict[str, Any]], filename: str = "JIRA_Summary_Report.docx"):
         """
         Generate Word document with issues grouped by project
         
         Args:
-            projects_data: Dictionary with project names as keys and project data as values
+            projects_data: Dictionary with project names as keys and project data as values.
+                A project's "ai_summary" may be a Future still being generated; summaries
+                are only waited on once every project's table has been built.
             filename: Output filename
         """
         try:
             print(f"Generating Word document: {filename}")
             
-            doc = Document()
-            
             # Add title
-            title = doc.add_heading("Projects monthly status report", 1)
-            title.alignment = 1  # Center alignment
+            body = [_paragraph_xml("Projects monthly status report", style="Heading1", center=True)]
+            pending_summaries = []
             
             # Process each project
             for project_name, project_data in projects_data.items():
@@ -163,42 +536,176 @@ class JiraToDocxAutomation:
                 project_summary = project_data.get("ai_summary", "No summary available")
                 
                 # Add project heading
-                doc.add_heading(f"{project_name}: Tasks completed or to be continued in the upcoming month.", 2)
+                body.append(_paragraph_xml(f"{project_name}: Tasks completed or to be continued in the upcoming month.", style="Heading2"))
                 
                 # Create table with headers
-                issues_table = doc.add_table(rows=1, cols=4)
-                issues_table.style = 'Table Grid'
-                
-                # Set table headers
-                hdr_cells = issues_table.rows[0].cells
-                hdr_cells[0].text = 'Issue Type'
-                hdr_cells[1].text = 'Issue key'
-                hdr_cells[2].text = 'Summary'
-                hdr_cells[3].text = 'Status'
+                body.append(TABLE_START_XML)
+                body.append(_table_row_xml(TABLE_HEADERS))
                 
                 # Add issues to table
-                for issue in issues:
-                    row_cells = issues_table.add_row().cells
-                    row_cells[0].text = issue.get("issue type", "N/A")
-                    row_cells[1].text = issue.get("issue key", "No key")
-                    row_cells[2].text = issue.get("summary", "No summary")
-                    row_cells[3].text = issue.get("status", "No status")
-
-                # Project summary section
-                doc.add_heading("Project Summary", level=3)
-                doc.add_paragraph(project_summary)
-                doc.add_page_break()
+                body.extend(_table_row_xml((
+                    issue.get("issue type", "N/A"),
+                    issue.get("issue key", "No key"),
+                    issue.get("summary", "No summary"),
+                    issue.get("status", "No status"),
+                )) for issue in issues)
+                body.append("</w:tbl>")
+
+                # Project summary section, filled in once all tables are built
+                body.append(_paragraph_xml("Project Summary", style="Heading3"))
+                pending_summaries.append((len(body), project_summary))
+                body.append(None)
+                body.append(PAGE_BREAK_XML)
+
+            for index, project_summary in pending_summaries:
+                if isinstance(project_summary, Future):
+                    project_summary = project_summary.result()
+                body[index] = _paragraph_xml(project_summary)
                 
             # Save document
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename_with_timestamp = f"{filename.split('.')[0]}_{timestamp}.docx"
-            doc.save(filename_with_timestamp)
+            _write_docx(DOCX_TEMPLATE, "".join(body), filename_with_timestamp)
             print(f"Document saved successfully as {filename}")
             
         except Exception as e:
             print(f"Error generating Word document: {e}")
     
 
+    def _extract_issue_data(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Extract the metadata used by the report from raw JIRA issues
+        
+        Args:
+            issues: Issue dictionaries as returned by the JIRA search API
+            
+        Returns:
+            List of flattened issue dictionaries
+        """
+        # Overlapping pages or JQLs can return the same issue twice; keep one row (and prompt line)
+        # per JIRA key. Issues without a key cannot be matched up, so they are all kept.
+        seen_keys = set()
+        unique_issues = []
+        for issue in issues:
+            key = issue.get("key")
+            if key:
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+            unique_issues.append(issue)
+        if len(unique_issues) < len(issues):
+            print(f"Removed {len(issues) - len(unique_issues)} duplicate issues")
+        
+        # JIRA returns null for unset fields, so fall back on falsy values rather than missing keys
+        issue_summaries = [{
+            "issue type": (fields.get("issuetype") or {}).get("name", "Unknown"),
+            "issue key": issue.get("key") or "No key",
+            "summary": fields.get("summary") or "No summary",
+            "status": (fields.get("status") or {}).get("name", "Unknown"),
+            "updated": fields.get("updated") or "Unknown",
+            "duedate": fields.get("duedate") or "No due date",
+            "priority": (fields.get("priority") or {}).get("name", "None"),
+        } for issue in unique_issues for fields in [issue.get("fields") or {}]]
+        
+        print(f"Processed {len(issue_summaries)} issues")
+        return issue_summaries
+
+    def _write_issue(self, buffer: io.StringIO, issue: Dict[str, Any]):
+        """Write one issue compactly into the LLM prompt buffer"""
+        summary = SUMMARY_TAG_PREFIX.sub("", issue["summary"]) or issue["summary"]
+        buffer.write(f"{issue['issue key']} {summary} (Priority: {issue['priority']}, Updated: {str(issue['updated'])[:10]}")
+        if issue["duedate"] and issue["duedate"] != "No due date":
+            buffer.write(f", Due: {issue['duedate']}")
+        buffer.write(")")
+
+    def _build_issues_string(self, issue_summaries: List[Dict[str, Any]]) -> str:
+        """
+        Format a project's issues as the text handed to the LLM
+        
+        Issues are grouped under one count-first line per status, which states
+        each status once instead of repeating field labels on every issue.
+        """
+        by_status = {}
+        for issue in issue_summaries:
+            by_status.setdefault(issue["status"], []).append(issue)
+
+        # Written straight into one buffer so no per-issue strings or lists are left to join
+        buffer = io.StringIO()
+        for status, issues in by_status.items():
+            if buffer.tell():
+                buffer.write("\n")
+            buffer.write(f"{status} ({len(issues)}): ")
+            for n, issue in enumerate(issues):
+                if n:
+                    buffer.write("; ")
+                self._write_issue(buffer, issue)
+
+        return buffer.getvalue()
+
+    def _compress_issues_string(self, issues_string: str) -> str:
+        """
+        Compress the issue list with LLMLingua before it is sent to Ollama
+        
+        Only called on a summary cache miss. llmlingua is an optional dependency;
+        if it is missing or fails, the text is returned unchanged so the report
+        is still generated.
+        """
+        # Summaries run on several worker threads; load the model once and run it one prompt at a time
+        with self._compressor_lock:
+            if self._compressor_failed:
+                return issues_string
+
+            try:
+                if self._prompt_compressor is None:
+                    from llmlingua import PromptCompressor
+
+                    print(f"Loading LLMLingua prompt compressor ({LLMLINGUA_MODEL} on {LLMLINGUA_DEVICE})...")
+                    self._prompt_compressor = PromptCompressor(LLMLINGUA_MODEL, device_map=LLMLINGUA_DEVICE)
+            except ImportError:
+                print("llmlingua is not installed; sending uncompressed issue lists")
+                self._compressor_failed = True
+                return issues_string
+            except Exception as e:
+                # Loading failed (e.g. no CUDA device); don't retry for every project
+                print(f"Could not load LLMLingua ({e}); sending uncompressed issue lists")
+                self._compressor_failed = True
+                return issues_string
+
+            try:
+                result = self._prompt_compressor.compress_prompt(issues_string, rate=LLMLINGUA_RATE)
+                return result["compressed_prompt"]
+            except Exception as e:
+                print(f"LLMLingua compression failed ({e}); sending the uncompressed issue list")
+                return issues_string
+
+    def _summarize_project(self, project_name: str, issues_string: str) -> str:
+        """Generate and print the AI summary for one project"""
+        with OLLAMA_SEMAPHORE:
+            print(f"\nGenerating AI summary for {project_name}...")
+            ai_summary = self.summarize_with_ollama(issues_string)
+        print(f"AI Summary for {project_name}:\n{ai_summary}")
+        return ai_summary
+
+    async def _summarize_project_async(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                       project_name: str, issues_string: str) -> str:
+        """Generate and print the AI summary for one project without blocking the event loop"""
+        async with semaphore:
+            ai_summary = await self.summarize_async(session, issues_string)
+        print(f"AI Summary for {project_name}:\n{ai_summary}")
+        return ai_summary
+
+    def _write_report(self, projects_data: Dict[str, Dict[str, Any]]):
+        """Generate the combined Word document and print the run summary"""
+        print(f"\n{'='*50}")
+        print("Generating combined Word document for all projects...")
+        
+        total_issues = sum(len(project_data["issues"]) for project_data in projects_data.values())
+        self.generate_word_document(projects_data)
+
+        print(f"\n{'='*50}")
+        print("Automation completed successfully!")
+        print(f"Generated report for {len(projects_data)} projects with {total_issues} total issues.")
+
     def run(self):
         """
         Main execution method for multiple projects
@@ -208,71 +715,110 @@ class JiraToDocxAutomation:
         
         projects_data = {}
         
-        # Process each project
-        for project_name in self.project_names:
-            print(f"\nProcessing project: {project_name}")
-            print("-" * 30)
+        # Projects are fetched concurrently and summaries are generated in the
+        # background, so building the document tables overlaps with the LLM decode
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Step 1: Fetch issues from JIRA for every project; results arrive in project order
+            fetched = executor.map(self.fetch_issues, self.project_names)
             
-            # Step 1: Fetch issues from JIRA for this project
-            issues = self.fetch_issues(project_name)
-            if not issues:
-                print(f"No issues found for project {project_name}")
+            # Process each project
+            for project_name, issues in zip(self.project_names, fetched):
+                print(f"\nProcessing project: {project_name}")
+                print("-" * 30)
+                
+                if not issues:
+                    print(f"No issues found for project {project_name}")
+                    projects_data[project_name] = {
+                        "issues": [],
+                        "ai_summary": f"No issues found for project {project_name}"
+                    }
+                    continue
+                
+                # Step 2: Process each issue
+                issue_summaries = self._extract_issue_data(issues)
+                
+                # Step 3: Queue AI summary for this project
+                issues_string = self._build_issues_string(issue_summaries)
+                ai_summary = executor.submit(self._summarize_project, project_name, issues_string)
+                
+                # Store project data
                 projects_data[project_name] = {
-                    "issues": [],
-                    "ai_summary": f"No issues found for project {project_name}"
+                    "issues": issue_summaries,
+                    "ai_summary": ai_summary
                 }
-                continue
             
-            # Step 2: Process each issue
-            issue_summaries = []
+            # Step 4: Generate combined Word document
+            self._write_report(projects_data)
+
+    async def run_all(self, projects: Optional[List[str]] = None):
+        """
+        Asynchronous execution method for multiple projects
+        
+        All JIRA fetches run concurrently, followed by all Ollama summaries,
+        over a single aiohttp session shared by the whole run. This is the entry
+        point for callers that already run an event loop; the command line uses run().
+        
+        Args:
+            projects: Project names to report on (defaults to the configured projects)
+        """
+        projects = projects if projects is not None else self.project_names
+        print("Starting JIRA to DOCX automation for multiple projects...")
+        print("=" * 50)
+        
+        projects_data = {}
+        issues_strings = {}
+        
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Step 1: Fetch issues from JIRA for every project at once
+            fetched = await asyncio.gather(*(self.fetch_issues_async(session, project_name) for project_name in projects))
             
-            for i, issue in enumerate(issues, 1):
-                # Extract metadata
-                fields = issue.get("fields", {})
-                issue_data = {
-                    "issue type": fields.get("issuetype", "Unknown").get("name", "Unknown"),
-                    "issue key": issue.get("key", "No key"),
-                    "summary": fields.get("summary", "No summary"),
-                    "status": fields.get("status", {}).get("name", "Unknown"),
-                    "created": fields.get("created", "Unknown"),
-                    "updated": fields.get("updated", "Unknown"),
-                    "duedate": fields.get("duedate", "No due date"),
-                    "priority": fields.get("priority", {}).get("name", "None"),
-                }
+            # Step 2: Process each project's issues
+            for project_name, issues in zip(projects, fetched):
+                if not issues:
+                    print(f"No issues found for project {project_name}")
+                    projects_data[project_name] = {
+                        "issues": [],
+                        "ai_summary": f"No issues found for project {project_name}"
+                    }
+                    continue
                 
-                issue_summaries.append(issue_data)
+                issue_summaries = self._extract_issue_data(issues)
+                projects_data[project_name] = {"issues": issue_summaries}
+                issues_strings[project_name] = self._build_issues_string(issue_summaries)
             
-            # Step 3: Generate AI summary for this project
-            issues_string = "\n".join([f"Issue Key: {issue['issue key']}, Summary: {issue['summary']}, Status: {issue['status']}, Created: {issue['created']}, Updated: {issue['updated']}, Due Date: {issue['duedate']}, Priority: {issue['priority']}" for issue in issue_summaries])
-            print(f"\nGenerating AI summary for {project_name}...")
-            ai_summary = self.summarize_with_ollama(issues_string)
-            print(f"AI Summary for {project_name}:\n{ai_summary}")
+            # Step 3: Start AI summaries for every project, at most OLLAMA_CONCURRENCY at a time
+            print(f"\nGenerating AI summaries for {len(issues_strings)} projects...")
+            loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(OLLAMA_CONCURRENCY)
+            for project_name, issues_string in issues_strings.items():
+                projects_data[project_name]["ai_summary"] = asyncio.run_coroutine_threadsafe(
+                    self._summarize_project_async(session, semaphore, project_name, issues_string), loop
+                )
             
-            # Store project data
-            projects_data[project_name] = {
-                "issues": issue_summaries,
-                "ai_summary": ai_summary
-            }
-        
-        # Step 4: Generate combined Word document
-        print(f"\n{'='*50}")
-        print("Generating combined Word document for all projects...")
-        
-        total_issues = sum(len(project_data["issues"]) for project_data in projects_data.values())
-        self.generate_word_document(projects_data)
-
-        print(f"\n{'='*50}")
-        print("Automation completed successfully!")
-        print(f"Generated report for {len(projects_data)} projects with {total_issues} total issues.")
+            # Step 4: Generate combined Word document in a worker thread while
+            # the summaries stream in on the event loop
+            await asyncio.to_thread(self._write_report, projects_data)
     
  
 def main():
     """Entry point for the application"""
+    parser = argparse.ArgumentParser(description="Generate a monthly JIRA status report as a Word document")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Regenerate every AI summary instead of reusing cached ones from .cache/ollama")
+    parser.add_argument("--compress-prompt", action="store_true",
+                        help="Compress the issue list with LLMLingua before summarizing (requires llmlingua)")
+    args = parser.parse_args()
+
     try:
      
         project_names = JiraToDocxAutomation.from_env_projects()
         print(f"Project names: {project_names}")
-        automation = JiraToDocxAutomation(project_names)
+        automation = JiraToDocxAutomation(
+            project_names,
+            use_cache=not args.no_cache,
+            compress_prompt=args.compress_prompt
+        )
         automation.run()
     except Exception as e:
         print(f"Error: {e}")
@@ -89,7 +89,8 @@ def check_dependencies():
     packages = {
         'requests': 'HTTP requests library',
         'docx': 'python-docx for Word documents',
-        'dotenv': 'python-dotenv for environment variables'
+        'dotenv': 'python-dotenv for environment variables',
+        'aiohttp': 'aiohttp for concurrent JIRA and Ollama requests'
     }
     
     all_available = True